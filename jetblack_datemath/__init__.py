@@ -8,7 +8,9 @@ from .arithmetic import (
     add_months,
     nearest_business_day,
     add_business_days,
+    add_business_days_many,
     adjust,
+    adjust_many,
     advance,
     end_of_month,
     add_nth_day_of_week,
@@ -38,7 +40,9 @@ __all__ = [
     'add_months',
     'nearest_business_day',
     'add_business_days',
+    'add_business_days_many',
     'adjust',
+    'adjust_many',
     'advance',
     'end_of_month',
     'add_nth_day_of_week',
@@ -1,16 +1,41 @@
 """Date Math"""
 
-import calendar
+from bisect import bisect_left, bisect_right
 import datetime
-from typing import Optional, Tuple
-
-from .weekdays import DayOfWeek
-from .months import MonthOfYear
-from .daterules import BusinessDayConvention
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from .weekdays import DayOfWeek, _MONDAY, _FRIDAY, _SATURDAY, _SUNDAY
+from .daterules import (
+    BusinessDayConvention,
+    _BDC_NONE,
+    _BDC_NEAREST,
+    _BDC_PRECEDING,
+    _BDC_FOLLOWING,
+    _BDC_MODIFIED_PRECEDING,
+    _BDC_MODIFIED_FOLLOWING
+)
 from .calendars import SimpleCalendar, AbstractCalendar
 
 _MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
+# The number of days in a non leap year before the start of each month.
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+_SATURDAY_SUNDAY_MASK = (1 << _SATURDAY) | (1 << _SUNDAY)
+_ALL_DAYS_MASK = (1 << 7) - 1
+
+_NO_DAYS = datetime.timedelta(0)
+_ONE_DAY = datetime.timedelta(1)
+_NEG_ONE_DAY = datetime.timedelta(-1)
+
+# The offset to the nearest business day, by the day of the week, for a
+# Saturday and Sunday weekend. As Friday and Monday are never equally near, the
+# preferred direction is not needed.
+_NEAREST_WEEKDAY_OFFSETS = (
+    _NO_DAYS, _NO_DAYS, _NO_DAYS, _NO_DAYS, _NO_DAYS, _NEG_ONE_DAY, _ONE_DAY
+)
+
 WEEKEND_CALENDAR = SimpleCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], [])
 
 
@@ -24,9 +49,12 @@ def days_in_month(year: int, month: int) -> int:
     Returns:
         int: The number of days in the month.
     """
-    return 29 if calendar.isleap(year) and month == 2 else _MONTH_DAYS[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
 
 
+@lru_cache(maxsize=256)
 def days_in_year(year: int) -> int:
     """Returns the number of days in the year
 
@@ -36,7 +64,7 @@ def days_in_year(year: int) -> int:
     Returns:
         int: The number of days in the year.
     """
-    return 366 if calendar.isleap(year) else 365
+    return 366 if days_in_month(year, 2) == 29 else 365
 
 
 def is_end_of_month(date: datetime.date) -> bool:
@@ -63,6 +91,9 @@ def add_months(date: datetime.date, months: int, eom: bool = False) -> datetime.
     Returns:
         datetime.date: The adjusted date.
     """
+    if months == 0:
+        return date
+
     month = date.month - 1 + months
     year = date.year + month // 12
     month = month % 12 + 1
@@ -90,12 +121,19 @@ def nearest_business_day(
     Returns:
         datetime.date: The nearest business day to a given date.
     """
+    if (
+            type(cal) is SimpleCalendar and  # pylint: disable=unidiomatic-typecheck
+            not cal.holidays and
+            cal._weekend_mask == _SATURDAY_SUNDAY_MASK  # pylint: disable=protected-access
+    ):
+        offset = _NEAREST_WEEKDAY_OFFSETS[date.weekday()]
+        return date + offset if offset else date
+
     if cal.is_business_day(date):
         return date
 
-    one_day = datetime.timedelta(1)
-    forward_date = date + one_day
-    backward_date = date - one_day
+    forward_date = date + _ONE_DAY
+    backward_date = date + _NEG_ONE_DAY
 
     while True:
         is_forward_ok = cal.is_business_day(forward_date)
@@ -104,8 +142,98 @@ def nearest_business_day(
             return forward_date
         elif is_backward_ok:
             return backward_date
-        forward_date += one_day
-        backward_date -= one_day
+        forward_date += _ONE_DAY
+        backward_date += _NEG_ONE_DAY
+
+
+def _add_weekdays(ordinal: int, count: int, weekend_mask: int) -> int:
+    """Add a number of week days, the days not on a weekend, to a proleptic
+    ordinal.
+
+    Args:
+        ordinal (int): The proleptic ordinal of the start date.
+        count (int): The number of week days to add.
+        weekend_mask (int): The bitmask of the weekend days of the week. At
+            least one day of the week must not be a weekend.
+
+    Returns:
+        int: The proleptic ordinal of the calculated date.
+    """
+    weekday = (ordinal + 6) % 7
+
+    if weekend_mask == _SATURDAY_SUNDAY_MASK:
+        if count > 0:
+            # Adding from a weekend is the same as adding from the Friday
+            # before.
+            if weekday > _FRIDAY:
+                ordinal -= weekday - _FRIDAY
+                weekday = _FRIDAY
+            weeks, days = divmod(count, 5)
+            if weekday + days > _FRIDAY:
+                days += 2
+            return ordinal + 7 * weeks + days
+        # Subtracting from a weekend is the same as subtracting from the
+        # Monday after.
+        if weekday > _FRIDAY:
+            ordinal += 7 - weekday
+            weekday = _MONDAY
+        weeks, days = divmod(-count, 5)
+        if weekday - days < _MONDAY:
+            days += 2
+        return ordinal - 7 * weeks - days
+
+    # Every whole week has the same number of week days, so skip whole weeks
+    # and step through the remaining days, of which there are at least one.
+    sign = 1 if count > 0 else -1
+    weeks, days = divmod(sign * count - 1, 7 - bin(weekend_mask).count('1'))
+    ordinal += sign * 7 * weeks
+    days += 1
+    while days:
+        ordinal += sign
+        weekday = (weekday + sign) % 7
+        if not (weekend_mask >> weekday) & 1:
+            days -= 1
+    return ordinal
+
+
+def _add_business_days_ordinal(
+        ordinal: int,
+        count: int,
+        weekend_mask: int,
+        holidays: Tuple[int, ...]
+) -> int:
+    """Add business days to a proleptic ordinal.
+
+    The week days are added in closed form, and the holidays skipped over are
+    counted by a binary search. The count is then extended by the skipped
+    holidays until no further holidays are found.
+
+    Args:
+        ordinal (int): The proleptic ordinal of the start date.
+        count (int): The number of business days to add.
+        weekend_mask (int): The bitmask of the weekend days of the week.
+        holidays (Tuple[int, ...]): The sorted ordinals of the holidays which fall
+            on week days.
+
+    Returns:
+        int: The proleptic ordinal of the calculated date.
+    """
+    if not holidays:
+        return _add_weekdays(ordinal, count, weekend_mask)
+
+    skipped = 0
+    while True:
+        if count > 0:
+            result = _add_weekdays(ordinal, count + skipped, weekend_mask)
+            found = bisect_right(holidays, result) - \
+                bisect_right(holidays, ordinal)
+        else:
+            result = _add_weekdays(ordinal, count - skipped, weekend_mask)
+            found = bisect_left(holidays, ordinal) - \
+                bisect_left(holidays, result)
+        if found == skipped:
+            return result
+        skipped = found
 
 
 def add_business_days(
@@ -124,19 +252,76 @@ def add_business_days(
     Returns:
         datetime.date: The calculated date.
     """
+    if count == 0:
+        return date
+
+    if (
+            type(cal) is SimpleCalendar and  # pylint: disable=unidiomatic-typecheck
+            cal._weekend_mask != _ALL_DAYS_MASK  # pylint: disable=protected-access
+    ):
+        return datetime.date.fromordinal(
+            _add_business_days_ordinal(
+                date.toordinal(),
+                count,
+                cal._weekend_mask,  # pylint: disable=protected-access
+                cal._holiday_ordinals  # pylint: disable=protected-access
+            )
+        )
+
     sign = 1 if count > 0 else -1
-    signed_day = datetime.timedelta(sign)
+    signed_day = _ONE_DAY if sign > 0 else _NEG_ONE_DAY
 
+    is_business_day = cal.is_business_day
     while count != 0:
         date += signed_day
         count -= sign
 
-        while not cal.is_business_day(date):
+        while not is_business_day(date):
             date += signed_day
 
     return date
 
 
+def add_business_days_many(
+        dates: Iterable[datetime.date],
+        count: int,
+        cal: AbstractCalendar = WEEKEND_CALENDAR
+) -> List[datetime.date]:
+    """Add business days to each of a number of dates.
+
+    This gives the same results as calling `add_business_days` for each
+    date, but the calendar is inspected once rather than for every date.
+
+    Args:
+        dates (Iterable[datetime.date]): The dates.
+        count (int): The number of days to add.
+        cal (AbstractCalendar, optional): The holiday calendar. Defaults to
+            WEEKEND_CALENDAR.
+
+    Returns:
+        List[datetime.date]: The calculated dates.
+    """
+    if count == 0:
+        return list(dates)
+
+    if (
+            type(cal) is SimpleCalendar and  # pylint: disable=unidiomatic-typecheck
+            cal._weekend_mask != _ALL_DAYS_MASK  # pylint: disable=protected-access
+    ):
+        weekend_mask = cal._weekend_mask  # pylint: disable=protected-access
+        holidays = cal._holiday_ordinals  # pylint: disable=protected-access
+        return [
+            datetime.date.fromordinal(
+                _add_business_days_ordinal(
+                    date.toordinal(), count, weekend_mask, holidays
+                )
+            )
+            for date in dates
+        ]
+
+    return [add_business_days(date, count, cal) for date in dates]
+
+
 def adjust(
         date: datetime.date,
         convention: BusinessDayConvention = BusinessDayConvention.FOLLOWING,
@@ -160,22 +345,22 @@ def adjust(
         datetime.date: [description]
     """
 
-    if convention == BusinessDayConvention.NONE or cal.is_business_day(date):
+    if convention == _BDC_NONE or cal.is_business_day(date):
         return date
-    elif convention == BusinessDayConvention.NEAREST:
+    elif convention == _BDC_NEAREST:
         return nearest_business_day(date, prefer_forward, cal)
-    elif convention == BusinessDayConvention.FOLLOWING:
+    elif convention == _BDC_FOLLOWING:
         return add_business_days(date, 1, cal)
-    elif convention == BusinessDayConvention.PRECEDING:
+    elif convention == _BDC_PRECEDING:
         return add_business_days(date, -1, cal)
-    elif convention == BusinessDayConvention.MODIFIED_FOLLOWING:
+    elif convention == _BDC_MODIFIED_FOLLOWING:
         adjusted_date = add_business_days(date, 1, cal)
 
         if adjusted_date.month == date.month:
             return adjusted_date
         else:
             return add_business_days(date, -1, cal)
-    elif convention == BusinessDayConvention.MODIFIED_PRECEDING:
+    elif convention == _BDC_MODIFIED_PRECEDING:
         adjusted_date = add_business_days(date, -1, cal)
 
         if adjusted_date.month == date.month:
@@ -186,6 +371,43 @@ def adjust(
         raise ValueError("Invalid business day convention")
 
 
+def adjust_many(
+        dates: Iterable[datetime.date],
+        convention: BusinessDayConvention = BusinessDayConvention.FOLLOWING,
+        prefer_forward: bool = True,
+        cal: AbstractCalendar = WEEKEND_CALENDAR
+) -> List[datetime.date]:
+    """Adjusts each of a number of dates with respect to the given convention.
+
+    This gives the same results as calling `adjust` for each date, but
+    business days are passed through with a single calendar check.
+
+    Args:
+        dates (Iterable[datetime.date]): The dates.
+        convention (BusinessDayConvention, optional): The business day
+            conventions. Defaults to BusinessDayConvention.FOLLOWING.
+        prefer_forward (bool, optional): If True prefer the nearest business day
+            in the future. Defaults to True.
+        cal (AbstractCalendar, optional): The holiday calendar. Defaults to
+            WEEKEND_CALENDAR.
+
+    Raises:
+        ValueError: If the business day convention is invalid.
+
+    Returns:
+        List[datetime.date]: The adjusted dates.
+    """
+    if convention == _BDC_NONE:
+        return list(dates)
+
+    is_business_day = cal.is_business_day
+    return [
+        date if is_business_day(date)
+        else adjust(date, convention, prefer_forward, cal)
+        for date in dates
+    ]
+
+
 def advance(
         date: datetime.date,
         days: Optional[int] = None,
@@ -194,13 +416,24 @@ def advance(
         years: Optional[int] = None,
         convention: BusinessDayConvention = BusinessDayConvention.FOLLOWING,
         eom: bool = False,
-        cal: AbstractCalendar = WEEKEND_CALENDAR
+        cal: AbstractCalendar = WEEKEND_CALENDAR,
+        fused_adjust: bool = False
 ) -> datetime.date:
     """Advances the given date of the given number of business days and
     returns the result.
     
     Note: The input date is not modified.
 
+    The date is adjusted after adding the years, again after adding the
+    months, and again after adding the weeks, before the business days are
+    added. If the fused adjust flag is set, the years, months and weeks are
+    added to the unadjusted date, and a single adjustment is made before the
+    business days are added. This can give a different result, as an
+    intermediate adjustment can move the date, so the flag is off by default.
+
+    Every adjustment, including the one after adding the weeks, uses the
+    given calendar.
+
     Args:
         date (datetime.date): The date.
         days (Optional[int], optional): The number of business days. Defaults to
@@ -214,6 +447,8 @@ def advance(
         eom (bool, optional): The end of month anchor. Defaults to False.
         cal (AbstractCalendar, optional): The holiday calendar. Defaults to
             WEEKEND_CALENDAR.
+        fused_adjust (bool, optional): If True adjust once after adding the
+            years, months and weeks. Defaults to False.
 
     Returns:
         datetime.date: The advanced date.
@@ -221,17 +456,24 @@ def advance(
     if not (days or weeks or months or years):
         return adjust(date, convention, cal=cal)
 
-    if years:
-        date = adjust(add_months(
-            date, 12 * years, eom), convention, cal=cal)
+    if fused_adjust:
+        if years or months or weeks:
+            date = add_months(date, 12 * (years or 0) + (months or 0), eom)
+            if weeks:
+                date += datetime.timedelta(days=7 * weeks)
+            date = adjust(date, convention, cal=cal)
+    else:
+        if years:
+            date = adjust(add_months(
+                date, 12 * years, eom), convention, cal=cal)
 
-    if months:
-        date = adjust(add_months(
-            date, months, eom), convention, cal=cal)
+        if months:
+            date = adjust(add_months(
+                date, months, eom), convention, cal=cal)
 
-    if weeks:
-        date = adjust(
-            date + datetime.timedelta(days=7 * weeks), convention)
+        if weeks:
+            date = adjust(
+                date + datetime.timedelta(days=7 * weeks), convention, cal=cal)
 
     if days:
         date = add_business_days(date, days, cal)
@@ -278,38 +520,21 @@ def add_nth_day_of_week(
     if nth == 0:
         return date
 
-    if dow < DayOfWeek.MONDAY or dow > DayOfWeek.FRIDAY:
+    if dow < _MONDAY or dow > _FRIDAY:
         return date
 
+    sign = 1 if nth > 0 else -1
     diff = dow - date.weekday()
 
     if diff == 0 and strictly_different:
-        nth += 1 if nth >= 0 else -1
-
-    # forwards
-    if nth > 0:
-        # If diff = 0 below, the input date is the 1st DOW already, no adjustment
-        # is required. The 'diff' is the adjustment from the input date
-        # required to get to the first DOW matching the 'dow_index' given.
-
-        if diff < 0:
-            diff += 7
+        nth += sign
 
-        adjusted_start_date = date + datetime.timedelta(diff)
-        end_date = adjusted_start_date + datetime.timedelta((nth - 1) * 7)
-        return end_date
-    # backwards
-    else:
-        # If diff = 0 below, the input date is the 1st DOW already, no adjustment
-        # is required. The 'diff' is the adjustment from the input date
-        # required to get to the first DOW matching the 'dow_index' given.
-
-        if diff > 0:
-            diff -= 7
+    # The 'diff' is the adjustment from the input date required to get to the
+    # first DOW matching the 'dow' given, in the direction of the count. If
+    # it is zero the input date is the 1st DOW already.
+    diff = diff % 7 if sign > 0 else -(-diff % 7)
 
-        adjusted_start_date = date + datetime.timedelta(diff)
-        end_date = adjusted_start_date + datetime.timedelta((nth + 1) * 7)
-        return end_date
+    return date + datetime.timedelta(diff + (nth - sign) * 7)
 
 
 def easter(year: int) -> datetime.date:
@@ -325,21 +550,18 @@ def easter(year: int) -> datetime.date:
 
     # pylint: disable=invalid-name
     y = year
-    g = (y - ((y // 19) * 19)) + 1
-    c = (y // 100) + 1
-    x = ((3 * c) // 4) - 12
-    z = (((8 * c) + 5) // 25) - 5
-    d = ((5 * y) // 4) - x - 10
-    e1 = (11 * g) + 20 + z - x
-    e = e1 - ((e1 // 30) * 30)
-
-    # The value of 'e' may be negative. The case of year = 14250, e.g.,
-    # produces values of g = 1, z = 40 and x = 95. The value of e1 is thus
-    # -24, and the 'mod' code fails to return the proper positive result.
-    # The following correction produces a positive value, mod 30, for 'e'.
+    g = y % 19 + 1
+    c = y // 100 + 1
+    x = (3 * c) // 4 - 12
+    z = (8 * c + 5) // 25 - 5
+    d = (5 * y) // 4 - x - 10
 
-    while e < 0:
-        e += 30
+    # The value of 'e1' may be negative. The case of year = 14250, e.g.,
+    # produces values of g = 1, z = 40 and x = 95. The value of e1 is thus
+    # -24. As the Python modulo takes the sign of the divisor, 'e' is always
+    # the proper positive value, mod 30.
+    e1 = 11 * g + 20 + z - x
+    e = e1 % 30
 
     if ((e == 25) and (g > 11)) or (e == 24):
         e += 1
@@ -349,9 +571,7 @@ def easter(year: int) -> datetime.date:
     if n < 21:
         n += 30
 
-    dpn = d + n
-    n1 = dpn - ((dpn // 7) * 7)
-    n = n + 7 - n1
+    n += 7 - (d + n) % 7
 
     if n > 31:
         month = 4
@@ -376,25 +596,24 @@ def days_and_months_between(start_date: datetime.date, end_date: datetime.date)
     if start_date == end_date:
         return 0, 0
 
-    start_date1 = datetime.date(start_date.year, start_date.month, 1)
-    end_date1 = datetime.date(end_date.year, end_date.month, 1)
-    months = (end_date1.year - start_date1.year) * \
-        12 + (end_date1.month - start_date1.month)
+    start_year, start_month, start_day = start_date.year, start_date.month, start_date.day
+    end_year, end_month, end_day = end_date.year, end_date.month, end_date.day
 
-    if not is_end_of_month(end_date) and (
-            is_end_of_month(start_date) or start_date.day > end_date.day
-    ):
+    start_days_in_month = days_in_month(start_year, start_month)
+    is_start_eom = start_day == start_days_in_month
+    is_end_eom = end_day == days_in_month(end_year, end_month)
+
+    months = (end_year - start_year) * 12 + (end_month - start_month)
+
+    if not is_end_eom and (is_start_eom or start_day > end_day):
         months -= 1
 
-    if start_date.day == end_date.day or (
-            is_end_of_month(start_date) and is_end_of_month(end_date)
-    ):
+    if start_day == end_day or (is_start_eom and is_end_eom):
         days = 0
-    elif start_date.day < end_date.day:
-        days = end_date.day - start_date.day
+    elif start_day < end_day:
+        days = end_day - start_day
     else:
-        days = days_in_month(start_date.year, start_date.month) - \
-            start_date.day + end_date.day
+        days = start_days_in_month - start_day + end_day
 
     return days, months
 
@@ -409,12 +628,8 @@ def are_in_same_quarter(first: datetime.date, second: datetime.date) -> bool:
     Returns:
         bool: True if the dates aare in the same quarter.
     """
-    if first > second:
-        return are_in_same_quarter(second, first) # pylint: disable=arguments-out-of-order
-
-    return first == second or (
-        first.year == second.year and second.month - first.month < 4 and (
-            second.month - 1) % 3 > (first.month - 1) % 3)
+    return first.year == second.year and \
+        (first.month - 1) // 3 == (second.month - 1) // 3
 
 
 def quarter_of_year(date: datetime.date) -> int:
@@ -426,14 +641,7 @@ def quarter_of_year(date: datetime.date) -> int:
     Returns:
         int: The quarter of the year from 1, 2, 3, 4.
     """
-    if date.month in [MonthOfYear.JANUARY, MonthOfYear.FEBRUARY, MonthOfYear.MARCH]:
-        return 1
-    elif date.month in [MonthOfYear.APRIL, MonthOfYear.MAY, MonthOfYear.JUNE]:
-        return 2
-    elif date.month in [MonthOfYear.JULY, MonthOfYear.AUGUST, MonthOfYear.SEPTEMBER]:
-        return 3
-    else:
-        return 4
+    return (date.month - 1) // 3 + 1
 
 
 def week_of_year(date: datetime.date, iso: bool = True) -> int:
@@ -449,4 +657,8 @@ def week_of_year(date: datetime.date, iso: bool = True) -> int:
     if iso:
         return date.isocalendar()[1]
     else:
-        return 1 + (date - datetime.date(date.year, 1, 1)).days // 7
+        year, month = date.year, date.month
+        day_of_year = _DAYS_BEFORE_MONTH[month - 1] + date.day
+        if month > 2 and days_in_month(year, 2) == 29:
+            day_of_year += 1
+        return 1 + (day_of_year - 1) // 7
@@ -1,16 +1,96 @@
 """Calendars"""
 
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict
 import datetime
-from typing import Dict, List, Sequence
+import threading
+import weakref
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
 
 # from .arithmetic import date
 from .weekdays import DayOfWeek
 
+# The dates of the holidays fetched by yearly calendars which share them,
+# keyed by the holiday cache key of the calendar and the year. The least
+# recently used year is evicted when the cache is full.
+_YEARLY_HOLIDAYS: 'OrderedDict[Hashable, FrozenSet[datetime.date]]' = (
+    OrderedDict()
+)
+_YEARLY_HOLIDAYS_MAXSIZE = 256
+# Guards the updates to the yearly holiday caches, which may be shared
+# between threads.
+_YEARLY_HOLIDAYS_LOCK = threading.Lock()
+
+
+class _HolidayOrdinals:  # pylint: disable=too-few-public-methods
+    """A holder for sorted holiday ordinals which can be weakly referenced"""
+
+    __slots__ = ('ordinals', '__weakref__')
+
+    def __init__(self, ordinals: Tuple[int, ...]) -> None:
+        self.ordinals = ordinals
+
+
+# The sorted holiday ordinals of simple calendars, interned so that live
+# calendars with the same holidays share them. An entry is dropped once no
+# calendar refers to it.
+_HOLIDAY_ORDINALS: (
+    'weakref.WeakValueDictionary[Tuple[int, ...], _HolidayOrdinals]'
+) = weakref.WeakValueDictionary()
+_HOLIDAY_ORDINALS_LOCK = threading.Lock()
+
+_ONE_DAY = datetime.timedelta(1)
+
+
+def _intern_holiday_ordinals(ordinals: Tuple[int, ...]) -> _HolidayOrdinals:
+    """Intern the sorted holiday ordinals of a calendar.
+
+    Args:
+        ordinals (Tuple[int, ...]): The sorted holiday ordinals.
+
+    Returns:
+        _HolidayOrdinals: The interned holiday ordinals, which must be held
+            by the calendar to keep them interned.
+    """
+    with _HOLIDAY_ORDINALS_LOCK:
+        interned = _HOLIDAY_ORDINALS.get(ordinals)
+        if interned is None:
+            interned = _HOLIDAY_ORDINALS[ordinals] = _HolidayOrdinals(ordinals)
+    return interned
+
 
 class AbstractCalendar(metaclass=ABCMeta):
     """Abstract calendar"""
 
+    __slots__ = ()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the calendar, for pickling and copying.
+
+        Defining this allows calendars with slots to be pickled with every
+        protocol.
+
+        Returns:
+            Dict[str, Any]: The values of the attributes, by name.
+        """
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the calendar, when unpickling and copying.
+
+        Args:
+            state (Dict[str, Any]): The values of the attributes, by name.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def is_weekend(self, target_date: datetime.date) -> bool:
         """If a weekend true, otherwise false
@@ -44,24 +124,100 @@ class AbstractCalendar(metaclass=ABCMeta):
             bool: True if a business day, otherwise false.
         """
 
+    def is_business_day_many(
+            self,
+            target_dates: Iterable[datetime.date]
+    ) -> List[bool]:
+        """For each date, true if a business day, otherwise false
+
+        Args:
+            target_dates (Iterable[datetime.date]): The target dates.
+
+        Returns:
+            List[bool]: For each date, true if a business day, otherwise false.
+        """
+        is_business_day = self.is_business_day
+        return [is_business_day(target_date) for target_date in target_dates]
+
+    def business_days_between(
+            self,
+            start: datetime.date,
+            end: datetime.date
+    ) -> int:
+        """The number of business days from the start date to the end date.
+
+        When the end date is after the start date this is the number of
+        business days after the start date up to and including the end date,
+        otherwise it is the negated number of business days from the end date
+        up to but excluding the start date. This is the number of business
+        days which must be added to the start date to arrive at the end date,
+        when the end date is a business day.
+
+        Args:
+            start (datetime.date): The start date.
+            end (datetime.date): The end date.
+
+        Returns:
+            int: The number of business days between the dates.
+        """
+        if end >= start:
+            first, last, sign = start + _ONE_DAY, end, 1
+        else:
+            first, last, sign = end, start - _ONE_DAY, -1
+
+        is_business_day = self.is_business_day
+        count = 0
+        while first <= last:
+            if is_business_day(first):
+                count += 1
+            first += _ONE_DAY
+        return sign * count
+
 
 class AbstractWeekendCalendar(AbstractCalendar):
     """AbstractWeekendCalendar"""
 
-    def __init__(self, weekends: Sequence[DayOfWeek]) -> None:
+    __slots__ = ('_weekends', '_weekend_mask')
+
+    def __init__(self, weekends: Iterable[DayOfWeek]) -> None:
         """Initialise the calendar.
 
         Args:
-            weekends (Sequence[DayOfWeek]): The days of the week that are holidays
+            weekends (Iterable[DayOfWeek]): The days of the week that are holidays
         """
         self.weekends = weekends
 
+    @property
+    def weekends(self) -> FrozenSet[int]:
+        """The days of the week that are holidays.
+
+        The weekends are held as a frozenset of plain integers for constant
+        time lookup. Setting the weekends refreshes the weekend bitmask used
+        for date arithmetic.
+
+        Returns:
+            FrozenSet[int]: The days of the week that are holidays.
+        """
+        return self._weekends
+
+    @weekends.setter
+    def weekends(self, weekends: Iterable[DayOfWeek]) -> None:
+        self._weekends: FrozenSet[int] = frozenset(int(day) for day in weekends)
+        # A bit is set for each day of the week that is a weekend.
+        self._weekend_mask = 0
+        for day in self._weekends:
+            self._weekend_mask |= 1 << day
+        self._weekends_changed()
+
+    def _weekends_changed(self) -> None:
+        """Called when the weekends have been set, to refresh derived state."""
+
     @abstractmethod
     def is_holiday(self, target_date: datetime.date) -> bool:
         ...
 
     def is_weekend(self, target_date: datetime.date) -> bool:
-        return target_date.weekday() in self.weekends
+        return target_date.weekday() in self._weekends
 
     def is_business_day(self, target_date: datetime.date) -> bool:
         return not (self.is_weekend(target_date) or self.is_holiday(target_date))
@@ -70,27 +226,206 @@ class AbstractWeekendCalendar(AbstractCalendar):
 class SimpleCalendar(AbstractWeekendCalendar):
     """SimpleCalendar"""
 
-    def __init__(self, weekends: List[DayOfWeek], holidays: List[datetime.date]) -> None:
+    __slots__ = ('_holidays', '_holiday_ordinals', '_interned_ordinals')
+
+    def __init__(
+            self,
+            weekends: Iterable[DayOfWeek],
+            holidays: Iterable[datetime.date]
+    ) -> None:
+        """Initialise the calendar.
+
+        The holidays are held as a frozenset for constant time lookup.
+
+        Args:
+            weekends (Iterable[DayOfWeek]): The days of the week that are holidays
+            holidays (Iterable[datetime.date]): The holiday dates
+        """
+        self._holidays: FrozenSet[datetime.date] = frozenset(holidays)
+        # Setting the weekends builds the holiday ordinals.
         super().__init__(weekends)
-        self.holidays = holidays
+
+    @property
+    def holidays(self) -> FrozenSet[datetime.date]:
+        """The holiday dates.
+
+        Setting the holidays refreshes the holiday ordinals used for date
+        arithmetic.
+
+        Returns:
+            FrozenSet[datetime.date]: The holiday dates.
+        """
+        return self._holidays
+
+    @holidays.setter
+    def holidays(self, holidays: Iterable[datetime.date]) -> None:
+        self._holidays = frozenset(holidays)
+        self._update_holiday_ordinals()
+
+    def _weekends_changed(self) -> None:
+        # Holidays on a weekend are left out of the holiday ordinals.
+        self._update_holiday_ordinals()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        # The holiday ordinals are interned again when the state is restored.
+        del state['_holiday_ordinals'], state['_interned_ordinals']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self.holidays = self._holidays
+
+    def _update_holiday_ordinals(self) -> None:
+        # These are first set in __init__, through the weekends setter.
+        # pylint: disable=attribute-defined-outside-init
+        # The sorted ordinals of the holidays which do not fall on a weekend,
+        # shared with other calendars having the same holidays. The tuple is
+        # held directly for the binary searches.
+        self._interned_ordinals = _intern_holiday_ordinals(
+            tuple(sorted(
+                holiday.toordinal()
+                for holiday in self._holidays
+                if holiday.weekday() not in self._weekends
+            ))
+        )
+        self._holiday_ordinals = self._interned_ordinals.ordinals
 
     def is_holiday(self, target_date: datetime.date) -> bool:
-        return target_date in self.holidays
+        return target_date in self._holidays
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The inlined business day check bypasses is_weekend and is_holiday,
+        # so subclasses overriding either use the check that calls them.
+        if cls.is_business_day is SimpleCalendar.is_business_day and (
+                cls.is_weekend is not SimpleCalendar.is_weekend or
+                cls.is_holiday is not SimpleCalendar.is_holiday
+        ):
+            setattr(
+                cls,
+                'is_business_day',
+                AbstractWeekendCalendar.is_business_day
+            )
+
+    def is_business_day(self, target_date: datetime.date) -> bool:
+        # Inline the weekend and holiday checks.
+        return not (
+            target_date.weekday() in self._weekends or
+            target_date in self._holidays
+        )
+
+    def is_business_day_many(
+            self,
+            target_dates: Iterable[datetime.date]
+    ) -> List[bool]:
+        if type(self) is not SimpleCalendar:  # pylint: disable=unidiomatic-typecheck
+            # Subclasses may change how business days are found.
+            return super().is_business_day_many(target_dates)
+
+        weekends, holidays = self._weekends, self._holidays
+        return [
+            not (target_date.weekday() in weekends or target_date in holidays)
+            for target_date in target_dates
+        ]
+
+    def business_days_between(
+            self,
+            start: datetime.date,
+            end: datetime.date
+    ) -> int:
+        if type(self) is not SimpleCalendar:  # pylint: disable=unidiomatic-typecheck
+            # Subclasses may change how business days are found.
+            return super().business_days_between(start, end)
+
+        # Count the week days of the half open range of ordinals in closed
+        # form, then remove the holidays in the range by a binary search.
+        if end >= start:
+            first, last, sign = start.toordinal() + 1, end.toordinal() + 1, 1
+        else:
+            first, last, sign = end.toordinal(), start.toordinal(), -1
+
+        weekend_mask = self._weekend_mask
+        weeks, days = divmod(last - first, 7)
+        count = weeks * (7 - bin(weekend_mask).count('1'))
+        weekday = (first + 6) % 7
+        for _ in range(days):
+            if not (weekend_mask >> weekday) & 1:
+                count += 1
+            weekday = (weekday + 1) % 7
+
+        holidays = self._holiday_ordinals
+        count -= bisect_left(holidays, last) - bisect_left(holidays, first)
+        return sign * count
 
 
 class YearlyCalendar(AbstractWeekendCalendar):
-    """YearlyCalendar"""
+    """YearlyCalendar
+
+    The holidays are fetched a year at a time, and are cached by year. The
+    least recently used years are evicted once the cache is full. The cache
+    is held on the instance, unless `holiday_cache_key` is overridden to share
+    it between calendars.
+    """
+
+    __slots__ = ('_holidays', '_last_year')
+
+    def __init__(self, weekends: Iterable[DayOfWeek]) -> None:
+        """Initialise the calendar.
+
+        The holidays of the most recently queried year are also held on the
+        instance, as consecutive queries are usually in the same year.
 
-    def __init__(self, weekends: List[DayOfWeek]) -> None:
+        Args:
+            weekends (Iterable[DayOfWeek]): The days of the week that are holidays
+        """
         super().__init__(weekends)
-        self._holidays: Dict[int, Dict[datetime.date, str]] = {}
+        self._holidays: 'OrderedDict[Hashable, FrozenSet[datetime.date]]' = (
+            OrderedDict()
+        )
+        # The year and its holidays are held together, so that threads never
+        # see the holidays of a different year.
+        self._last_year: Tuple[int, FrozenSet[datetime.date]] = (0, frozenset())
 
-    def is_holiday(self, target_date: datetime.date) -> bool:
-        if target_date.year not in self._holidays:
-            self._holidays[target_date.year] = self.fetch_holidays(
-                target_date.year)
+    def holiday_cache_key(self) -> Optional[Hashable]:
+        """The key under which the fetched holidays are shared.
+
+        By default the holidays are cached on the instance. Calendars which
+        always fetch the same holidays, for example all instances of a class
+        with no state of their own, can return the same key here to share
+        them.
 
-        return target_date in self._holidays[target_date.year]
+        Returns:
+            Optional[Hashable]: The key under which the holidays are shared,
+                or None to cache them on the instance.
+        """
+        return None
+
+    def is_holiday(self, target_date: datetime.date) -> bool:
+        year = target_date.year
+        last_year, year_holidays = self._last_year
+        if year != last_year:
+            key: Hashable = self.holiday_cache_key()
+            if key is None:
+                cache, key = self._holidays, year
+            else:
+                cache, key = _YEARLY_HOLIDAYS, (key, year)
+            with _YEARLY_HOLIDAYS_LOCK:
+                holidays = cache.get(key)
+                if holidays is not None:
+                    cache.move_to_end(key)
+            if holidays is None:
+                # The holidays are fetched outside the lock, so a year may
+                # be fetched twice, but a slow fetch does not block others.
+                holidays = frozenset(self.fetch_holidays(year))
+                with _YEARLY_HOLIDAYS_LOCK:
+                    cache[key] = holidays
+                    if len(cache) > _YEARLY_HOLIDAYS_MAXSIZE:
+                        cache.popitem(last=False)
+            self._last_year = (year, holidays)
+            year_holidays = holidays
+
+        return target_date in year_holidays
 
     @abstractmethod
     def fetch_holidays(self, year: int) -> Dict[datetime.date, str]:
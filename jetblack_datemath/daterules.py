@@ -11,3 +11,12 @@ class BusinessDayConvention(IntEnum):
     FOLLOWING = 3
     MODIFIED_PRECEDING = 4
     MODIFIED_FOLLOWING = 5
+
+# The plain integer values of the business day conventions, for comparisons
+# in hot paths without the enum attribute lookup.
+_BDC_NONE = BusinessDayConvention.NONE.value
+_BDC_NEAREST = BusinessDayConvention.NEAREST.value
+_BDC_PRECEDING = BusinessDayConvention.PRECEDING.value
+_BDC_FOLLOWING = BusinessDayConvention.FOLLOWING.value
+_BDC_MODIFIED_PRECEDING = BusinessDayConvention.MODIFIED_PRECEDING.value
+_BDC_MODIFIED_FOLLOWING = BusinessDayConvention.MODIFIED_FOLLOWING.value
@@ -11,3 +11,13 @@ class DayOfWeek(IntEnum):
     FRIDAY = 4
     SATURDAY = 5
     SUNDAY = 6
+
+# The plain integer values of the days of the week, for comparisons in hot
+# paths without the enum attribute lookup.
+_MONDAY = DayOfWeek.MONDAY.value
+_TUESDAY = DayOfWeek.TUESDAY.value
+_WEDNESDAY = DayOfWeek.WEDNESDAY.value
+_THURSDAY = DayOfWeek.THURSDAY.value
+_FRIDAY = DayOfWeek.FRIDAY.value
+_SATURDAY = DayOfWeek.SATURDAY.value
+_SUNDAY = DayOfWeek.SUNDAY.value
@@ -0,0 +1,39 @@
+"""Test fixtures"""
+
+from datetime import date
+
+import pytest
+
+from jetblack_datemath.calendars import SimpleCalendar
+from jetblack_datemath.weekdays import DayOfWeek
+
+
+@pytest.fixture(scope="module")
+def christmas_2014_cal() -> SimpleCalendar:
+    """A calendar with the Christmas 2014 holidays.
+
+    Calendars are built once and shared, as they would be in use.
+    """
+    return SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2014, 12, 25), date(2014, 12, 26)]
+    )
+
+
+@pytest.fixture(scope="module")
+def holidays_2015_cal() -> SimpleCalendar:
+    """A calendar with the 2015 holidays.
+
+    Calendars are built once and shared, as they would be in use.
+    """
+    return SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [
+            date(2015, 1, 1),
+            date(2015, 4, 3),
+            date(2015, 4, 6),
+            date(2015, 5, 1),
+            date(2015, 12, 25),
+            date(2015, 12, 16)
+        ]
+    )
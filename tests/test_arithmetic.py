@@ -1,9 +1,19 @@
 """Tests"""
 
+from collections import OrderedDict
+import copy
 from datetime import date
+import gc
+import pickle
+from typing import Dict, Hashable, List, Optional, Set
 import jetblack_datemath.arithmetic as datemath
 from jetblack_datemath.daterules import BusinessDayConvention
-from jetblack_datemath.calendars import SimpleCalendar
+from jetblack_datemath import calendars
+from jetblack_datemath.calendars import (
+    AbstractWeekendCalendar,
+    SimpleCalendar,
+    YearlyCalendar
+)
 from jetblack_datemath.weekdays import DayOfWeek
 
 
@@ -60,12 +70,9 @@ def test_is_end_of_month():
     ), "28 February 2009 is the end of the month because it's a not leap year."
 
 
-def test_is_holiday():
+def test_is_holiday(christmas_2014_cal: SimpleCalendar):
     """Test for holidays"""
-    cal = SimpleCalendar(
-        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
-        [date(2014, 12, 25), date(2014, 12, 26)]
-    )
+    cal = christmas_2014_cal
     assert cal.is_holiday(
         date(2014, 12, 25)
     ), "Thursday 25 December 2014 is a holiday."
@@ -77,12 +84,236 @@ def test_is_holiday():
     ), "Saturday 27 December 2014 is not a holiday."
 
 
-def test_is_business_day():
-    """Test for Business days"""
+def test_calendar_construction():
+    """Test constructing simple calendars"""
+    cal = SimpleCalendar(
+        (DayOfWeek(day) for day in range(5, 7)),
+        (date(2014, 12, day) for day in (25, 26, 25))
+    )
+    assert cal.holidays == {
+        date(2014, 12, 25), date(2014, 12, 26)
+    }, "Holidays can be any iterable, and duplicates are removed."
+    assert cal.is_weekend(
+        date(2014, 12, 27)
+    ), "Weekends can be any iterable."
+    assert not hasattr(
+        cal, '__dict__'
+    ), "Calendars should only have slots."
+
+
+def test_calendar_pickle():
+    """Test pickling and copying calendars"""
+    # pylint: disable=protected-access
+    cal = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2014, 12, 25), date(2014, 12, 26)]
+    )
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        other = pickle.loads(pickle.dumps(cal, protocol=protocol))
+        assert other.weekends == cal.weekends, "The weekends should be restored."
+        assert other.holidays == cal.holidays, "The holidays should be restored."
+        assert other._holiday_ordinals is cal._holiday_ordinals, \
+            "The restored calendar should share the holiday ordinals."
+        assert date(2014, 12, 29) == datemath.add_business_days(
+            date(2014, 12, 24), 1, other
+        ), "The restored calendar should skip the holidays."
+    other = copy.deepcopy(cal)
+    assert other._holiday_ordinals is cal._holiday_ordinals, \
+        "The copied calendar should share the holiday ordinals."
+
+    yearly = ChristmasCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY])
+    yearly.is_holiday(date(2014, 12, 25))
+    other = pickle.loads(pickle.dumps(yearly, protocol=0))
+    assert other.is_holiday(
+        date(2014, 12, 25)
+    ), "The restored yearly calendar should find the holidays."
+
+
+def test_holiday_ordinals_interned():
+    """Test the holiday ordinals are shared between simple calendars"""
+    # pylint: disable=protected-access
     cal = SimpleCalendar(
         [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
         [date(2014, 12, 25), date(2014, 12, 26)]
     )
+    other = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2014, 12, 26), date(2014, 12, 25), date(2014, 12, 27)]
+    )
+    assert other._holiday_ordinals is cal._holiday_ordinals, \
+        "Calendars with the same holidays should share the holiday ordinals."
+
+    cal = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2016, 12, 26), date(2016, 12, 27)]
+    )
+    ordinals = cal._holiday_ordinals
+    assert ordinals in calendars._HOLIDAY_ORDINALS, \
+        "The holiday ordinals should be interned."
+    del cal
+    gc.collect()
+    assert ordinals not in calendars._HOLIDAY_ORDINALS, \
+        "The holiday ordinals should not be held once the calendar is gone."
+
+
+class ChristmasCalendar(YearlyCalendar):
+    """A yearly calendar with Christmas Day as the only holiday"""
+
+    fetched: List[int] = []
+
+    def holiday_cache_key(self) -> Optional[Hashable]:
+        return ChristmasCalendar
+
+    def fetch_holidays(self, year: int) -> Dict[date, str]:
+        self.fetched.append(year)
+        return {date(year, 12, 25): "Christmas Day"}
+
+
+def test_yearly_calendar():
+    """Test yearly calendars"""
+    weekends = [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY]
+    cal = ChristmasCalendar(weekends)
+    assert cal.is_holiday(
+        date(2014, 12, 25)
+    ), "Thursday 25 December 2014 is a holiday."
+    assert not cal.is_holiday(
+        date(2014, 12, 26)
+    ), "Friday 26 December 2014 is not a holiday."
+    assert not cal.is_business_day(
+        date(2015, 12, 25)
+    ), "Friday 25 December 2015 is not a business day."
+    assert ChristmasCalendar(weekends).is_holiday(
+        date(2015, 12, 25)
+    ), "Friday 25 December 2015 is a holiday."
+    assert cal.is_business_day_many(
+        [date(2015, 12, 24), date(2015, 12, 25), date(2015, 12, 28)]
+    ) == [True, False, True], "Should match checking each date."
+    assert ChristmasCalendar.fetched == [
+        2014, 2015
+    ], "The holidays should be fetched once per year for the class."
+
+
+def test_yearly_calendar_per_instance():
+    """Test yearly calendars cache the holidays of each instance"""
+
+    class AnnualHolidayCalendar(YearlyCalendar):
+        """A yearly calendar with a single holiday on a given day"""
+
+        __slots__ = ('month', 'day')
+
+        def __init__(self, weekends: List[DayOfWeek], month: int, day: int):
+            super().__init__(weekends)
+            self.month, self.day = month, day
+
+        def fetch_holidays(self, year: int) -> Dict[date, str]:
+            return {date(year, self.month, self.day): "Holiday"}
+
+    weekends = [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY]
+    independence_day = AnnualHolidayCalendar(weekends, 7, 4)
+    boxing_day = AnnualHolidayCalendar(weekends, 12, 26)
+    assert independence_day.is_holiday(
+        date(2015, 7, 4)
+    ), "Saturday 4 July 2015 is a holiday."
+    assert not boxing_day.is_holiday(
+        date(2015, 7, 4)
+    ), "The holidays of another instance should not be used."
+    assert boxing_day.is_holiday(
+        date(2015, 12, 26)
+    ), "Saturday 26 December 2015 is a holiday."
+
+
+def test_yearly_calendar_eviction(monkeypatch):
+    """Test the least recently used years are evicted from the cache"""
+    monkeypatch.setattr(calendars, '_YEARLY_HOLIDAYS', OrderedDict())
+    monkeypatch.setattr(calendars, '_YEARLY_HOLIDAYS_MAXSIZE', 2)
+
+    class BoxingDayCalendar(YearlyCalendar):
+        """A yearly calendar with Boxing Day as the only holiday"""
+
+        fetched: List[int] = []
+
+        def holiday_cache_key(self) -> Optional[Hashable]:
+            return BoxingDayCalendar
+
+        def fetch_holidays(self, year: int) -> Dict[date, str]:
+            self.fetched.append(year)
+            return {date(year, 12, 26): "Boxing Day"}
+
+    weekends = [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY]
+    for year in [2014, 2015, 2014, 2016, 2014, 2015]:
+        assert BoxingDayCalendar(weekends).is_holiday(
+            date(year, 12, 26)
+        ), "Boxing Day is a holiday."
+    assert BoxingDayCalendar.fetched == [
+        2014, 2015, 2016, 2015
+    ], "The least recently used year should be evicted."
+
+
+class FirstOfMonthCalendar(SimpleCalendar):
+    """A simple calendar with the first of every month also a holiday"""
+
+    def is_holiday(self, target_date: date) -> bool:
+        return target_date.day == 1 or super().is_holiday(target_date)
+
+
+def test_is_business_day_subclass():
+    """Test business days use the holidays of a simple calendar subclass"""
+    cal = FirstOfMonthCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], [])
+    assert cal.is_holiday(
+        date(2015, 6, 1)
+    ), "Monday 1 June 2015 is a holiday."
+    assert not cal.is_business_day(
+        date(2015, 6, 1)
+    ), "Monday 1 June 2015 is not a business day."
+    assert date(2015, 6, 2) == datemath.add_business_days(
+        date(2015, 5, 29), 1, cal
+    ), "Should skip the weekend and the Monday holiday."
+    target_dates = [date(2015, 5, 29), date(2015, 6, 1), date(2015, 6, 2)]
+    assert cal.is_business_day_many(target_dates) == [
+        cal.is_business_day(target_date) for target_date in target_dates
+    ], "Should match checking each date."
+
+    class MondayHolidayCalendar(SimpleCalendar):
+        """A simple calendar where no Monday is a business day"""
+
+        def is_business_day(self, target_date: date) -> bool:
+            return target_date.weekday() != DayOfWeek.MONDAY and \
+                super().is_business_day(target_date)
+
+    cal = MondayHolidayCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], [])
+    assert cal.is_business_day_many(
+        [date(2015, 6, 1), date(2015, 6, 2)]
+    ) == [False, True], "Should use the business days of the subclass."
+
+
+def test_is_business_day_changed_holidays():
+    """Test business days follow the holidays of a weekend calendar"""
+
+    class MutableCalendar(AbstractWeekendCalendar):
+        """A weekend calendar with holidays which can be changed"""
+
+        __slots__ = ('holidays',)
+
+        def __init__(self, weekends: List[DayOfWeek]):
+            super().__init__(weekends)
+            self.holidays: Set[date] = set()
+
+        def is_holiday(self, target_date: date) -> bool:
+            return target_date in self.holidays
+
+    cal = MutableCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY])
+    assert cal.is_business_day(
+        date(2014, 12, 25)
+    ), "Thursday 25 December 2014 is a business day."
+    cal.holidays.add(date(2014, 12, 25))
+    assert not cal.is_business_day(
+        date(2014, 12, 25)
+    ), "Thursday 25 December 2014 is now a holiday."
+
+
+def test_is_business_day(christmas_2014_cal: SimpleCalendar):
+    """Test for Business days"""
+    cal = christmas_2014_cal
     assert cal.is_business_day(
         date(2014, 12, 24)
     ), "Wednesday 24 December 2014 is a business day."
@@ -101,6 +332,11 @@ def test_is_business_day():
     assert cal.is_business_day(
         date(2014, 12, 29
              )), "Monday 29 December 2014 is a business day."
+    assert cal.is_business_day_many(
+        [date(2014, 12, day) for day in range(24, 30)]
+    ) == [
+        True, False, False, False, False, True
+    ], "Should match checking each date."
 
 
 def test_add_months():
@@ -157,18 +393,9 @@ def test_easter():
     assert date(2021, 4, 4) == datemath.easter(2021), "Easter 2021"
 
 
-def test_add_business_days():
+def test_add_business_days(holidays_2015_cal: SimpleCalendar):
     """Test adding business days"""
-    cal = SimpleCalendar(
-        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
-        [
-            date(2015, 1, 1),
-            date(2015, 4, 3),
-            date(2015, 4, 6),
-            date(2015, 5, 1),
-            date(2015, 12, 25),
-            date(2015, 12, 16)]
-    )
+    cal = holidays_2015_cal
     # Forward
     assert date(2015, 1, 8) == datemath.add_business_days(
         date(2015, 1, 1), 5, cal
@@ -191,6 +418,149 @@ def test_add_business_days():
     ), "Nothing to skip."
 
 
+def test_add_business_days_over_weekends():
+    """Test adding business days from weekends and over long periods"""
+    cal = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [
+            date(2015, 1, 1),
+            date(2015, 4, 3),
+            date(2015, 4, 6),
+            date(2015, 5, 1),
+            date(2015, 12, 25),
+            date(2015, 12, 26),
+            date(2015, 12, 16)]
+    )
+    assert date(2015, 1, 5) == datemath.add_business_days(
+        date(2015, 1, 3), 1, cal
+    ), "Saturday should roll to Monday."
+    assert date(2015, 1, 2) == datemath.add_business_days(
+        date(2015, 1, 4), -1, cal
+    ), "Sunday should roll to Friday."
+    assert date(2015, 12, 28) == datemath.add_business_days(
+        date(2015, 12, 24), 1, cal
+    ), "Should skip Christmas and a holiday on a weekend."
+    assert date(2015, 12, 24) == datemath.add_business_days(
+        date(2015, 1, 2), 250, cal
+    ), "Should skip all the holidays in the year."
+    assert date(2015, 1, 8) == datemath.add_business_days(
+        date(2015, 12, 31), -250, cal
+    ), "Should skip all the holidays in the year."
+    assert date(2015, 1, 3) == datemath.add_business_days(
+        date(2015, 1, 3), 0, cal
+    ), "Adding no days should not adjust."
+    assert date(2015, 12, 17) == datemath.add_business_days(
+        date(2015, 1, 1), 250
+    ), "Fifty weeks of business days without holidays."
+    assert date(2015, 1, 1) == datemath.add_business_days(
+        date(2015, 12, 17), -250
+    ), "Fifty weeks of business days without holidays."
+
+
+def test_add_business_days_other_weekends():
+    """Test adding business days with a Friday and Saturday weekend"""
+    cal = SimpleCalendar(
+        [DayOfWeek.FRIDAY, DayOfWeek.SATURDAY],
+        [date(2015, 1, 5)]
+    )
+    assert date(2015, 1, 4) == datemath.add_business_days(
+        date(2015, 1, 1), 1, cal
+    ), "Thursday should roll to Sunday."
+    assert date(2015, 1, 6) == datemath.add_business_days(
+        date(2015, 1, 1), 2, cal
+    ), "Should skip the Monday holiday."
+    assert date(2015, 1, 1) == datemath.add_business_days(
+        date(2015, 1, 4), -1, cal
+    ), "Sunday should roll back to Thursday."
+
+
+def test_add_business_days_changed_calendar():
+    """Test adding business days after the calendar has changed"""
+    cal = SimpleCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], [])
+    cal.holidays = [date(2015, 1, 2)]
+    assert cal.holidays == {
+        date(2015, 1, 2)
+    }, "Holidays can be set with any iterable."
+    assert date(2015, 1, 5) == datemath.add_business_days(
+        date(2015, 1, 1), 1, cal
+    ), "Should skip the new Friday holiday."
+    cal.weekends = [DayOfWeek.SUNDAY]
+    assert cal.weekends == {
+        DayOfWeek.SUNDAY
+    }, "Weekends can be set with any iterable."
+    assert date(2015, 1, 3) == datemath.add_business_days(
+        date(2015, 1, 1), 1, cal
+    ), "Saturday should no longer be skipped."
+    cal.holidays = [date(2015, 1, 3)]
+    cal.weekends = []
+    assert date(2015, 1, 4) == datemath.add_business_days(
+        date(2015, 1, 2), 1, cal
+    ), "A Saturday holiday should be skipped when not a weekend."
+
+
+def test_add_business_days_many():
+    """Test adding business days to many dates"""
+    holidays = [date(2015, 1, 1), date(2015, 12, 25)]
+    dates = [date(2014, 12, 31), date(2015, 1, 3), date(2015, 12, 24)]
+    cal = SimpleCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], holidays)
+    assert datemath.add_business_days_many(dates, 1, cal) == [
+        date(2015, 1, 2), date(2015, 1, 5), date(2015, 12, 28)
+    ], "Should match adding business days to each date."
+    cal = SimpleCalendar([DayOfWeek.FRIDAY, DayOfWeek.SATURDAY], holidays)
+    assert datemath.add_business_days_many(dates, 1, cal) == [
+        date(2015, 1, 4), date(2015, 1, 4), date(2015, 12, 27)
+    ], "Should match adding business days to each date."
+    assert datemath.add_business_days_many(dates, 0, cal) == dates, \
+        "Adding no days should not adjust."
+
+
+def test_business_days_between(christmas_2014_cal: SimpleCalendar):
+    """Test counting the business days between dates"""
+    #            December 2014
+    # Su Mo Tu We Th Fr Sa
+    #     1  2  3  4  5  6
+    #  7  8  9 10 11 12 13
+    # 14 15 16 17 18 19 20
+    # 21 22 23 24 25 26 27
+    # 28 29 30 31
+    cal = christmas_2014_cal
+    assert cal.business_days_between(
+        date(2014, 12, 24), date(2014, 12, 29)
+    ) == 1, "The end date is counted, but not the start date."
+    assert cal.business_days_between(
+        date(2014, 12, 29), date(2014, 12, 24)
+    ) == -1, "The end date is counted, but not the start date."
+    assert cal.business_days_between(
+        date(2014, 12, 27), date(2014, 12, 29)
+    ) == 1, "Counting from a weekend is the same as from the Friday before."
+    assert cal.business_days_between(
+        date(2014, 12, 27), date(2014, 12, 22)
+    ) == -3, "The holidays are not counted."
+    assert cal.business_days_between(
+        date(2014, 12, 1), date(2014, 12, 31)
+    ) == 20, "There are 22 week days less 2 holidays."
+    assert cal.business_days_between(
+        date(2014, 12, 25), date(2014, 12, 25)
+    ) == 0, "There are no business days between the same date."
+    yearly = ChristmasCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY])
+    assert yearly.business_days_between(
+        date(2014, 12, 1), date(2015, 1, 31)
+    ) == 43, "Calendars can count by checking each date."
+    for count in [-12, -5, -1, 0, 1, 5, 12]:
+        start = date(2014, 12, 20)
+        end = datemath.add_business_days(start, count, cal)
+        assert cal.business_days_between(
+            start, end
+        ) == count, "Should count the business days added."
+
+    cal = FirstOfMonthCalendar([DayOfWeek.SATURDAY, DayOfWeek.SUNDAY], [])
+    end = datemath.add_business_days(date(2015, 5, 29), 2, cal)
+    assert end == date(2015, 6, 3), "Should skip Monday 1 June 2015."
+    assert cal.business_days_between(
+        date(2015, 5, 29), end
+    ) == 2, "Should count with the holidays of the subclass."
+
+
 def test_nearest_business_day():
     """Test for nearest business day"""
     #              July 2015
@@ -216,6 +586,15 @@ def test_nearest_business_day():
     assert date(2015, 7, 10) == datemath.nearest_business_day(
         date(2015, 7, 12), False, cal
     ), "Sunday should prefer to roll to Friday"
+    assert date(2015, 7, 3) == datemath.nearest_business_day(
+        date(2015, 7, 4), False
+    ), "Saturday should roll to Friday without holidays"
+    assert date(2015, 7, 13) == datemath.nearest_business_day(
+        date(2015, 7, 12), False
+    ), "Sunday should roll to Monday without holidays"
+    assert date(2015, 7, 13) == datemath.nearest_business_day(
+        date(2015, 7, 13)
+    ), "Monday is a business day without holidays"
 
 
 def test_add_nth_day_of_week():
@@ -253,18 +632,9 @@ def test_add_nth_day_of_week():
     ), "Third Wednesday from the end of the month.."
 
 
-def test_adjust():
+def test_adjust(holidays_2015_cal: SimpleCalendar):
     """Test date adjustment"""
-    weekends = [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY]
-    holidays = [
-        date(2015, 1, 1),
-        date(2015, 4, 3),
-        date(2015, 4, 6),
-        date(2015, 5, 1),
-        date(2015, 12, 25),
-        date(2015, 12, 16)
-    ]
-    cal = SimpleCalendar(weekends, holidays)
+    cal = holidays_2015_cal
 
     jan_first = date(2015, 1, 1)
     jan_second = date(2015, 1, 2)
@@ -278,3 +648,120 @@ def test_adjust():
     assert datemath.adjust(
         jan_first, BusinessDayConvention.FOLLOWING, True, cal
     ) == jan_second, "Adjusted to January 2."
+
+    # Many dates
+    assert datemath.adjust_many(
+        [jan_first, jan_second], BusinessDayConvention.FOLLOWING, True, cal
+    ) == [jan_second, jan_second], "Adjusted to January 2."
+    assert datemath.adjust_many(
+        [jan_first, jan_second], BusinessDayConvention.NONE, True, cal
+    ) == [jan_first, jan_second], "No adjustment."
+
+
+def test_quarter_of_year():
+    """Test the quarter of the year"""
+    assert datemath.quarter_of_year(date(2015, 1, 1)) == 1, "January is Q1."
+    assert datemath.quarter_of_year(date(2015, 3, 31)) == 1, "March is Q1."
+    assert datemath.quarter_of_year(date(2015, 4, 1)) == 2, "April is Q2."
+    assert datemath.quarter_of_year(date(2015, 6, 30)) == 2, "June is Q2."
+    assert datemath.quarter_of_year(date(2015, 7, 1)) == 3, "July is Q3."
+    assert datemath.quarter_of_year(date(2015, 9, 30)) == 3, "September is Q3."
+    assert datemath.quarter_of_year(date(2015, 10, 1)) == 4, "October is Q4."
+    assert datemath.quarter_of_year(date(2015, 12, 31)) == 4, "December is Q4."
+
+
+def test_are_in_same_quarter():
+    """Test if dates are in the same quarter"""
+    assert datemath.are_in_same_quarter(
+        date(2015, 1, 1), date(2015, 1, 1)
+    ), "The same date is in the same quarter."
+    assert datemath.are_in_same_quarter(
+        date(2015, 1, 5), date(2015, 1, 10)
+    ), "Dates in the same month are in the same quarter."
+    assert datemath.are_in_same_quarter(
+        date(2015, 1, 1), date(2015, 3, 31)
+    ), "January and March are in the same quarter."
+    assert datemath.are_in_same_quarter(
+        date(2015, 3, 31), date(2015, 1, 1)
+    ), "The order of the dates should not matter."
+    assert not datemath.are_in_same_quarter(
+        date(2015, 3, 31), date(2015, 4, 1)
+    ), "March and April are in different quarters."
+    assert not datemath.are_in_same_quarter(
+        date(2015, 1, 1), date(2016, 1, 1)
+    ), "The same quarter in different years is not the same quarter."
+
+
+def test_advance():
+    """Test advancing dates"""
+    assert date(2015, 1, 5) == datemath.advance(
+        date(2015, 1, 3)
+    ), "Nothing to add should adjust Saturday to Monday."
+    assert date(2015, 1, 5) == datemath.advance(
+        date(2015, 1, 2), days=1
+    ), "Friday plus one business day is Monday."
+    assert date(2015, 3, 2) == datemath.advance(
+        date(2015, 1, 30), months=1
+    ), "Saturday 28 February should roll to Monday."
+    assert date(2015, 3, 2) == datemath.advance(
+        date(2014, 1, 31), years=1, months=1
+    ), "Saturday 31 January 2015 should roll to Monday 2 February."
+    assert date(2014, 2, 6) == datemath.advance(
+        date(2013, 1, 4), years=1, months=1
+    ), "Should adjust for Saturday 4 January 2014 before adding the months."
+    assert date(2014, 2, 4) == datemath.advance(
+        date(2013, 1, 4), years=1, months=1, fused_adjust=True
+    ), "Should adjust once after the years and months."
+    assert date(2015, 1, 1) == datemath.advance(
+        date(2015, 1, 1), years=1, months=-12
+    ), "Years and months should cancel out."
+
+    cal = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2015, 12, 24)]
+    )
+    assert date(2016, 1, 1) == datemath.advance(
+        date(2015, 11, 24), weeks=1, months=1, cal=cal
+    ), "Should adjust after the months and after the weeks."
+    assert date(2015, 12, 31) == datemath.advance(
+        date(2015, 11, 24), weeks=1, months=1, cal=cal, fused_adjust=True
+    ), "Should adjust once after the months and weeks."
+
+
+def test_advance_weeks_calendar():
+    """Test the adjustment after advancing by weeks uses the calendar"""
+    cal = SimpleCalendar(
+        [DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        [date(2015, 12, 24)]
+    )
+    assert date(2015, 12, 25) == datemath.advance(
+        date(2015, 12, 17), weeks=1, cal=cal
+    ), "Should roll over the Thursday 24 December holiday."
+
+
+def test_week_of_year():
+    """Test the week of the year"""
+    assert datemath.week_of_year(
+        date(2015, 1, 1)
+    ) == 1, "Thursday 1 January 2015 is in ISO week 1."
+    assert datemath.week_of_year(
+        date(2016, 1, 1)
+    ) == 53, "Friday 1 January 2016 is in ISO week 53."
+    assert datemath.week_of_year(
+        date(2016, 1, 1), False
+    ) == 1, "1 January is always in week 1."
+    assert datemath.week_of_year(
+        date(2015, 1, 7), False
+    ) == 1, "7 January is always in week 1."
+    assert datemath.week_of_year(
+        date(2015, 1, 8), False
+    ) == 2, "8 January is always in week 2."
+    assert datemath.week_of_year(
+        date(2015, 12, 31), False
+    ) == 53, "31 December 2015 is in week 53."
+    assert datemath.week_of_year(
+        date(2016, 12, 30), False
+    ) == 53, "30 December 2016 is in week 53 of a leap year."
+    assert datemath.week_of_year(
+        date(2015, 12, 30), False
+    ) == 52, "30 December 2015 is in week 52."